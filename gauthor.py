@@ -2,87 +2,482 @@
 
 import subprocess
 import argparse
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import importlib.util
+import io
+import itertools
 import os
+import re
+import tempfile
+import threading
 from collections import defaultdict
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import (
+    List,
+    Dict,
+    Any,
+    BinaryIO,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    Type,
+    Union,
+)
 import time
 import json
-from groq import Groq  # type: ignore
+import httpx
+from groq import AsyncGroq, BadRequestError, RateLimitError  # type: ignore
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+try:
+    import tiktoken  # type: ignore
+except ImportError:
+    tiktoken = None
+
+try:
+    import zstandard  # type: ignore
+except ImportError:
+    zstandard = None
+
+# Constants for the model
+MODEL = "llama-3.3-70b-versatile"
+TEMPERATURE = 0.1
+MAX_OUTPUT_TOKENS = 2000
+CONTEXT_LIMIT = 131072  # Context window of llama-3.3-70b-versatile, in tokens
+
+# Constants for API concurrency
+MAX_IN_FLIGHT = 5  # Maximum number of concurrent Groq requests
+MAX_RETRIES = 3  # Retries of a request rejected for exceeding the rate limit
+# Groq rate limits for llama-3.3-70b-versatile
+REQUESTS_PER_MINUTE = 30
+TOKENS_PER_MINUTE = 12000
 
 # Constants for chunking
-MAX_COMMITS_PER_CHUNK = 50
-MAX_TOKENS_PER_CHUNK = 8000  # Conservative limit for Groq's context window
-
-client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+PROMPT_OVERHEAD_TOKENS = 500  # Instructions sent along with each chunk
+# Make chunks as large as a single request allows: the context window, or the
+# per-minute token limit if that is smaller, minus the prompt and the response
+MAX_TOKENS_PER_CHUNK = (
+    min(CONTEXT_LIMIT, TOKENS_PER_MINUTE) - MAX_OUTPUT_TOKENS - PROMPT_OVERHEAD_TOKENS
+)
+
+# Matches the "%h|%ad|%s" header line that starts each commit in the git log
+COMMIT_HEADER_RE = re.compile(r"^[0-9a-f]{7,40}\|\d{4}-\d{2}-\d{2}\|")
+
+# Matches a Conventional Commits subject, capturing its type and description
+CONVENTIONAL_COMMIT_RE = re.compile(
+    r"^(feat|fix|docs|refactor|chore|ci|build|perf|test|style)(\(.+\))?!?:\s*(.+)"
+)
+CONVENTIONAL_COVERAGE_THRESHOLD = 0.8  # Share of commits needed to skip the LLM
+
+# Constants for merging analyses
+WORD_RE = re.compile(r"\w+")
+DEDUP_SIMILARITY_THRESHOLD = 0.7  # Word 3-gram Jaccard similarity to merge items
+
+# Constants for caching LLM responses
+CACHE_DIR = os.path.expanduser("~/.cache/gauthor")
+CACHE_TTL = 30 * 24 * 60 * 60  # 30 days, in seconds
+GIT_LOG_CACHE_DIR = os.path.join(CACHE_DIR, "gitlog")
+ZSTD_LEVEL = 3  # Compression level for cache files when zstandard is installed
+# Errors raised when reading a corrupt cache file, which is treated as a miss
+CACHE_READ_ERRORS: Tuple[Type[Exception], ...] = (OSError, ValueError)
+if zstandard is not None:
+    CACHE_READ_ERRORS += (zstandard.ZstdError,)
+
+# Share one pooled connection, multiplexed over HTTP/2 when h2 is installed,
+# across all concurrent requests instead of opening a new one per call
+http_client = httpx.AsyncClient(
+    http2=importlib.util.find_spec("h2") is not None,
+    limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+    timeout=60.0,
+)
+# The SDK's own retries are disabled so rate limit errors reach create_completion,
+# which pauses every worker instead of retrying just the one request
+client = AsyncGroq(
+    api_key=os.getenv("GROQ_API_KEY"), http_client=http_client, max_retries=0
+)
 # Ensure the Groq API key is set
 if not os.environ.get("GROQ_API_KEY"):
     print("Please set your Groq API key as an environment variable GROQ_API_KEY.")
     exit(1)
 
 
-def get_author_commits(
-    author_identifiers: List[str], max_commits: Optional[int] = None
-) -> Optional[str]:
-    """Get all commits by the specified author identifiers with detailed information."""
+class RateLimiter:
+    """Token buckets that throttle API requests to stay under the request and token rate limits."""
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.request_capacity = float(requests_per_minute)
+        self.token_capacity = float(tokens_per_minute)
+        self.available_request_capacity = self.request_capacity
+        self.available_token_capacity = self.token_capacity
+        self.last_update = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = asyncio.Lock()
+
+    def replenish(self) -> None:
+        """Refill both buckets for the time elapsed since the last update."""
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        self.available_request_capacity = min(
+            self.request_capacity,
+            self.available_request_capacity + elapsed * self.request_capacity / 60,
+        )
+        self.available_token_capacity = min(
+            self.token_capacity,
+            self.available_token_capacity + elapsed * self.token_capacity / 60,
+        )
+        self.last_update = now
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until a request consuming the given tokens stays within the rate limits."""
+        # A request larger than the whole bucket could otherwise never be sent
+        tokens = min(tokens, int(self.token_capacity))
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+
+                self.replenish()
+                request_deficit = 1 - self.available_request_capacity
+                token_deficit = tokens - self.available_token_capacity
+                if request_deficit <= 0 and token_deficit <= 0:
+                    self.available_request_capacity -= 1
+                    self.available_token_capacity -= tokens
+                    return
+
+                await asyncio.sleep(
+                    max(
+                        request_deficit * 60 / self.request_capacity,
+                        token_deficit * 60 / self.token_capacity,
+                    )
+                )
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all requests for the given number of seconds after a rate-limit error."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+rate_limiter = RateLimiter(REQUESTS_PER_MINUTE, TOKENS_PER_MINUTE)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(value: Any) -> bytes:
+    """Serialize a value to JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode()
+
+
+def cache_file_name(key: str, extension: str) -> str:
+    """Return the name of a cache file, marking it as compressed when zstd is installed."""
+    if zstandard is not None:
+        return f"{key}{extension}.zst"
+    return f"{key}{extension}"
+
+
+def compress(data: bytes) -> bytes:
+    """Compress cache data with zstd when it is installed."""
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return data
+
+
+def decompress(data: bytes) -> bytes:
+    """Decompress cache data written by compress()."""
+    if zstandard is not None:
+        return zstandard.ZstdDecompressor().decompress(data)
+    return data
+
+
+def text_reader(f: BinaryIO) -> TextIO:
+    """Read text from a cache file, decompressing it as a stream when zstd is installed."""
+    if zstandard is not None:
+        f = zstandard.ZstdDecompressor().stream_reader(f)
+    return io.TextIOWrapper(f)
+
+
+def text_writer(f: BinaryIO) -> TextIO:
+    """Write text to a cache file, compressing it as a stream when zstd is installed."""
+    if zstandard is not None:
+        f = zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(f)
+    return io.TextIOWrapper(f)
+
+
+def cache_key(system_prompt: str, prompt: str) -> str:
+    """Compute a cache key for an LLM request from everything that affects its response."""
+    request = {
+        "model": MODEL,
+        "system": system_prompt,
+        "prompt": prompt,
+        "temp": TEMPERATURE,
+    }
+    return hashlib.sha256(json.dumps(request, sort_keys=True).encode()).hexdigest()
+
+
+def load_cached(key: str) -> Optional[Any]:
+    """Return the cached response for the key, or None if missing or expired."""
+    cache_path = os.path.join(CACHE_DIR, cache_file_name(key, ".json"))
     try:
-        # Create a shell command that will work reliably
-        author_pattern = "\\|".join(author_identifiers)
+        if time.time() - os.path.getmtime(cache_path) > CACHE_TTL:
+            return None
+        with open(cache_path, "rb") as f:
+            return json_loads(decompress(f.read()))
+    except CACHE_READ_ERRORS:
+        return None
 
-        # Build the base command
-        base_cmd = f'git log --author="{author_pattern}" --pretty=format:"%h|%ad|%s" --date=short --name-status'
 
-        # Add max commits if specified
-        if max_commits:
-            base_cmd += f" -n {max_commits}"
+def save_cached(key: str, value: Any) -> None:
+    """Atomically write a response to the cache."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(compress(json_dumps(value)))
+        os.replace(tmp_path, os.path.join(CACHE_DIR, cache_file_name(key, ".json")))
+    except OSError as e:
+        print(f"Error writing cache: {e}")
+
+
+@functools.lru_cache(maxsize=None)
+def get_encoding() -> Optional[Any]:
+    """Load the BPE encoding used to count tokens, if tiktoken is installed."""
+    if tiktoken is None:
+        return None
+    try:
+        # cl100k_base is the closest public BPE to the llama-3 tokenizer
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        print(f"Error loading tiktoken encoding, estimating tokens instead: {e}")
+        return None
 
-        # Run the command using shell=True for more reliable execution
-        result = subprocess.run(base_cmd, shell=True, capture_output=True, text=True)
 
-        # Check if we got any output
-        if result.returncode != 0 or not result.stdout.strip():
-            return None
+def count_tokens(text: str) -> int:
+    """Count the tokens in the text, estimating from its length without tiktoken."""
+    encoding = get_encoding()
+    if encoding is None:
+        # Rough estimate of tokens (1 token ≈ 4 chars)
+        return len(text) // 4
+    return len(encoding.encode(text, disallowed_special=()))
 
-        return result.stdout
-    except Exception as e:
-        print(f"Error getting git log: {e}")
+
+def git_log_command(
+    author_identifiers: List[str], max_commits: Optional[int] = None
+) -> List[str]:
+    """Build the git log command listing commits by the specified author identifiers."""
+    author_pattern = "\\|".join(author_identifiers)
+
+    # Build the command as a list so the pattern needs no shell quoting
+    cmd = [
+        "git",
+        "log",
+        f"--author={author_pattern}",
+        "--pretty=format:%h|%ad|%s",
+        "--date=short",
+        "--name-status",
+    ]
+
+    # Add max commits if specified
+    if max_commits:
+        cmd += ["-n", str(max_commits)]
+
+    return cmd
+
+
+def git_log_cache_path(cmd: List[str]) -> Optional[str]:
+    """Return the cache file for a git log command at the current HEAD, if in a repository."""
+    try:
+        repo, head = subprocess.check_output(
+            ["git", "rev-parse", "--show-toplevel", "HEAD"],
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).splitlines()
+    except (OSError, ValueError, subprocess.CalledProcessError):
         return None
 
+    key = hashlib.sha256(f"{repo}|{head}|{json.dumps(cmd)}".encode()).hexdigest()
+    return os.path.join(GIT_LOG_CACHE_DIR, cache_file_name(key, ".txt"))
+
 
-def chunk_commits(commit_log: str) -> List[str]:
-    """Split commits into manageable chunks for API processing."""
-    if not commit_log:
-        return []
+def get_author_commits(
+    author_identifiers: List[str],
+    max_commits: Optional[int] = None,
+    refresh: bool = False,
+) -> Iterator[str]:
+    """Stream the git log lines for the specified author identifiers.
+
+    The output is cached per repository HEAD, so re-running on an unchanged
+    repository reads the cached log instead of running git log again.
+    """
+    cmd = git_log_command(author_identifiers, max_commits)
+    cache_path = git_log_cache_path(cmd)
+    cached_lines = 0
+    if cache_path and not refresh and os.path.exists(cache_path):
+        try:
+            with text_reader(open(cache_path, "rb")) as f:
+                for line in f:
+                    yield line
+                    cached_lines += 1
+            return
+        except CACHE_READ_ERRORS as e:
+            # Discard a corrupt cache file and read the log from git instead,
+            # skipping the lines that were already read from the cache
+            print(f"Ignoring corrupt git log cache: {e}")
+            try:
+                os.unlink(cache_path)
+            except OSError:
+                pass
 
-    commits = commit_log.split("\n\n")
-    chunks: List[str] = []
+    try:
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+    except Exception as e:
+        print(f"Error getting git log: {e}")
+        return
+
+    # Write the log to a temporary file while streaming it, and only move it
+    # into the cache once git log has finished successfully
+    cache_file = None
+    if cache_path:
+        try:
+            os.makedirs(GIT_LOG_CACHE_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=GIT_LOG_CACHE_DIR, suffix=".tmp")
+            cache_file = text_writer(os.fdopen(fd, "wb"))
+        except OSError as e:
+            print(f"Error writing cache: {e}")
+
+    completed = False
+    try:
+        with process.stdout:
+            for line in process.stdout:
+                if cache_file:
+                    cache_file.write(line)
+                if cached_lines:
+                    cached_lines -= 1
+                    continue
+                yield line
+        completed = True
+    finally:
+        returncode = process.wait()
+        if cache_file:
+            cache_file.close()
+            if completed and returncode == 0:
+                os.replace(tmp_path, cache_path)
+            else:
+                os.unlink(tmp_path)
+
+
+def iter_commits(lines: Iterable[str]) -> Iterator[str]:
+    """Group git log output lines into one string per commit."""
+    commit: List[str] = []
+    for line in lines:
+        if COMMIT_HEADER_RE.match(line) and commit:
+            yield "".join(commit).strip()
+            commit = []
+        commit.append(line)
+
+    if commit:
+        yield "".join(commit).strip()
+
+
+def iter_chunks(lines: Iterable[str]) -> Iterator[str]:
+    """Lazily split streamed commits into manageable chunks for API processing."""
     current_chunk: List[str] = []
     current_chunk_size = 0
 
-    for commit in commits:
-        # Rough estimate of tokens (1 token ≈ 4 chars)
-        commit_size = len(commit) // 4
+    for commit in iter_commits(lines):
+        commit_size = count_tokens(commit)
 
-        if current_chunk_size + commit_size > MAX_TOKENS_PER_CHUNK:
-            chunks.append("\n\n".join(current_chunk))
+        if current_chunk and current_chunk_size + commit_size > MAX_TOKENS_PER_CHUNK:
+            yield "\n\n".join(current_chunk)
             current_chunk = [commit]
             current_chunk_size = commit_size
         else:
             current_chunk.append(commit)
             current_chunk_size += commit_size
 
-        if len(current_chunk) >= MAX_COMMITS_PER_CHUNK:
-            chunks.append("\n\n".join(current_chunk))
-            current_chunk = []
-            current_chunk_size = 0
-
     if current_chunk:
-        chunks.append("\n\n".join(current_chunk))
+        yield "\n\n".join(current_chunk)
 
-    return chunks
+
+def retry_after(error: RateLimitError, attempt: int) -> float:
+    """Return how long to wait before retrying a rate-limited request."""
+    try:
+        return float(error.response.headers["retry-after"])
+    except (AttributeError, KeyError, ValueError):
+        return 2.0**attempt
+
+
+def is_json_validation_error(error: Exception) -> bool:
+    """Check whether Groq rejected a JSON mode response because it was not valid JSON."""
+    if not isinstance(error, BadRequestError):
+        return False
+    code = getattr(error, "code", None)
+    body = getattr(error, "body", None)
+    # The SDK may leave the error's code nested in the response body
+    if code is None and isinstance(body, dict):
+        details = body.get("error", body)
+        if isinstance(details, dict):
+            code = details.get("code")
+    return code == "json_validate_failed"
+
+
+async def create_completion(
+    messages: List[Dict[str, str]], temperature: float = TEMPERATURE, **kwargs: Any
+) -> str:
+    """Send a rate-limited chat completion request, retrying if it is rejected with a 429."""
+    tokens = sum(count_tokens(m["content"]) for m in messages) + MAX_OUTPUT_TOKENS
+    for attempt in range(MAX_RETRIES + 1):
+        await rate_limiter.acquire(tokens)
+        try:
+            completion = await client.chat.completions.create(
+                messages=messages,
+                model=MODEL,
+                temperature=temperature,
+                max_tokens=MAX_OUTPUT_TOKENS,
+                **kwargs,
+            )
+            return completion.choices[0].message.content
+        except RateLimitError as e:
+            if attempt == MAX_RETRIES:
+                raise
+            delay = retry_after(e, attempt)
+            print(f"Rate limited by Groq, retrying in {delay:.0f}s...")
+            rate_limiter.pause(delay)
+
+
+async def request_json(messages: List[Dict[str, str]], temperature: float) -> Any:
+    """Send a chat completion in JSON mode and parse the response."""
+    response = await create_completion(
+        messages, temperature, response_format={"type": "json_object"}
+    )
+    return json_loads(response)
 
 
-def analyze_commit_chunk(chunk: str) -> Optional[Dict[str, Any]]:
+async def analyze_commit_chunk(
+    chunk: str, use_cache: bool = True
+) -> Optional[Dict[str, Any]]:
     """Analyze a chunk of commits using Groq API to generate a detailed summary."""
     prompt = f"""Analyze the following git commit history and provide a detailed summary of the author's contributions.
     
@@ -99,40 +494,115 @@ def analyze_commit_chunk(chunk: str) -> Optional[Dict[str, Any]]:
     Git commit history:
     {chunk}
     
-    Respond in the following JSON format:
-    {{
-        "summary": "A concise paragraph summarizing the author's overall contributions",
-        "features": ["Detailed description of feature 1", "Detailed description of feature 2", ...],
-        "technologies": ["Technology 1 with context", "Technology 2 with context", ...],
-        "code_quality": "Analysis of code quality, patterns, and architecture decisions",
-        "technical_skills": ["Skill 1 with evidence", "Skill 2 with evidence", ...],
-        "notable_achievements": ["Achievement 1 with impact", "Achievement 2 with impact", ...]
-    }}
+    Return JSON with keys: summary and code_quality (strings), features, technologies, technical_skills and notable_achievements (lists of strings).
     """
+    system_prompt = "You are a helpful assistant that analyzes git commit histories to provide detailed summaries of contributions, focusing on technical skills and implementation details."
 
-    try:
-        completion = client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a helpful assistant that analyzes git commit histories to provide detailed summaries of contributions, focusing on technical skills and implementation details.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            model="llama-3.3-70b-versatile",
-            temperature=0.1,
-            max_tokens=2000,
-        )
+    key = cache_key(system_prompt, prompt)
+    if use_cache:
+        cached = load_cached(key)
+        if cached is not None:
+            return cached
 
-        response = completion.choices[0].message.content
-        # Extract JSON from the response
-        json_str = response[response.find("{") : response.rfind("}") + 1]
-        return json.loads(json_str)
+    messages = [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": prompt},
+    ]
+    try:
+        try:
+            analysis = await request_json(messages, TEMPERATURE)
+        except (json.JSONDecodeError, BadRequestError) as e:
+            # Retry once deterministically if the response was not valid JSON,
+            # which JSON mode reports as a json_validate_failed request error
+            if isinstance(e, BadRequestError) and not is_json_validation_error(e):
+                raise
+            analysis = await request_json(messages, 0)
+        if use_cache:
+            save_cached(key, analysis)
+        return analysis
     except Exception as e:
         print(f"Error analyzing commits with Groq: {e}")
         return None
 
 
+def classify_conventional_commits(
+    chunk: str,
+) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+    """Build an analysis locally if most of the chunk's commits follow Conventional Commits.
+
+    Also returns the commits without a conventional subject, which it does not cover.
+    """
+    commit_count = 0
+    unmatched: List[str] = []
+    descriptions: Dict[str, List[str]] = defaultdict(list)
+    for commit in iter_commits(chunk.splitlines(keepends=True)):
+        header = commit.split("\n", 1)[0]
+        if not COMMIT_HEADER_RE.match(header):
+            continue
+        commit_count += 1
+        match = CONVENTIONAL_COMMIT_RE.match(header.split("|", 2)[2])
+        if match:
+            descriptions[match.group(1)].append(match.group(3))
+        else:
+            unmatched.append(commit)
+
+    matched = sum(len(items) for items in descriptions.values())
+    if not commit_count or matched < CONVENTIONAL_COVERAGE_THRESHOLD * commit_count:
+        return None, unmatched
+
+    counts = ", ".join(
+        f"{len(items)} {commit_type}" for commit_type, items in descriptions.items()
+    )
+    code_quality = [
+        f"{label}: {'; '.join(descriptions[commit_type])}."
+        for commit_type, label in [
+            ("refactor", "Refactoring"),
+            ("style", "Style"),
+            ("test", "Tests"),
+            ("docs", "Documentation"),
+            ("build", "Build"),
+            ("ci", "CI"),
+            ("chore", "Maintenance"),
+        ]
+        if descriptions[commit_type]
+    ]
+    analysis = {
+        "summary": f"{commit_count} commits ({counts}).",
+        "features": descriptions["feat"],
+        "technologies": [],
+        "code_quality": " ".join(code_quality),
+        "technical_skills": [],
+        "notable_achievements": [f"Fixed {d}" for d in descriptions["fix"]]
+        + [f"Improved performance: {d}" for d in descriptions["perf"]],
+    }
+    return analysis, unmatched
+
+
+def shingles(text: str, size: int = 3) -> Set[Tuple[str, ...]]:
+    """Split text into overlapping shingles of its lowercased words."""
+    words = WORD_RE.findall(text.lower())
+    return {tuple(words[i : i + size]) for i in range(max(len(words) - size + 1, 1))}
+
+
+def dedup_semantic(items: List[Any]) -> List[Any]:
+    """Collapse near-duplicate items, keeping the longest wording of each."""
+    # Each cluster holds the shingles of its representative and the representative
+    clusters: List[Tuple[Set[Tuple[str, ...]], Any]] = []
+    for item in items:
+        item_shingles = shingles(str(item))
+        for index, (cluster_shingles, representative) in enumerate(clusters):
+            union = len(item_shingles | cluster_shingles)
+            overlap = len(item_shingles & cluster_shingles)
+            if union and overlap / union >= DEDUP_SIMILARITY_THRESHOLD:
+                if len(str(item)) > len(str(representative)):
+                    clusters[index] = (item_shingles, item)
+                break
+        else:
+            clusters.append((item_shingles, item))
+
+    return [representative for _, representative in clusters]
+
+
 def merge_analyses(analyses: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
     """Merge multiple chunk analyses into a single comprehensive summary."""
     # Initialize merged result
@@ -163,71 +633,67 @@ def merge_analyses(analyses: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
     if code_quality:
         merged["code_quality"] = " ".join(code_quality)
 
-    # Remove duplicates while preserving order
+    # Remove duplicates and near-duplicates while preserving order
     for key in ["features", "technologies", "technical_skills", "notable_achievements"]:
         if isinstance(merged[key], list):
-            merged[key] = list(dict.fromkeys(merged[key]))
+            merged[key] = dedup_semantic(merged[key])
 
     return merged
 
 
-def format_summary(summary: Dict[str, Any], author_identifiers: List[str]) -> str:
-    """Format the analysis summary into a readable report."""
+def report_lines(
+    summary: Dict[str, Any], author_identifiers: List[str]
+) -> Iterator[str]:
+    """Yield the lines of the readable report for an analysis summary."""
     # Create a display string for the author identifiers
     author_display = ", ".join(author_identifiers)
 
-    report = [
-        f"\n📊 Detailed Contribution Analysis for {author_display}",
-        "=" * (len(author_display) + 35),
-        f"\n📝 Summary:",
-        f"   {summary.get('summary', 'No summary available.')}",
-    ]
+    yield f"\n📊 Detailed Contribution Analysis for {author_display}"
+    yield "=" * (len(author_display) + 35)
+    yield f"\n📝 Summary:"
+    yield f"   {summary.get('summary', 'No summary available.')}"
 
     # Add features if available
     features = summary.get("features", [])
     if features:
-        report.append(f"\n✨ Implemented Features:")
-        for feature in features:
-            report.append(f"   • {feature}")
+        yield f"\n✨ Implemented Features:"
+        yield from (f"   • {feature}" for feature in features)
 
     # Add technologies if available
     technologies = summary.get("technologies", [])
     if technologies:
-        report.append(f"\n🔧 Technologies & Libraries:")
-        for tech in technologies:
-            report.append(f"   • {tech}")
+        yield f"\n🔧 Technologies & Libraries:"
+        yield from (f"   • {tech}" for tech in technologies)
 
     # Add code quality analysis if available
     code_quality = summary.get("code_quality", "")
     if code_quality:
-        report.append(f"\n📈 Code Quality & Architecture:")
-        report.append(f"   {code_quality}")
+        yield f"\n📈 Code Quality & Architecture:"
+        yield f"   {code_quality}"
 
     # Add technical skills if available
     skills = summary.get("technical_skills", [])
     if skills:
-        report.append(f"\n💻 Technical Skills Demonstrated:")
-        for skill in skills:
-            report.append(f"   • {skill}")
+        yield f"\n💻 Technical Skills Demonstrated:"
+        yield from (f"   • {skill}" for skill in skills)
 
     # Add notable achievements if available
     achievements = summary.get("notable_achievements", [])
     if achievements:
-        report.append(f"\n🏆 Notable Achievements:")
-        for achievement in achievements:
-            report.append(f"   • {achievement}")
+        yield f"\n🏆 Notable Achievements:"
+        yield from (f"   • {achievement}" for achievement in achievements)
 
-    return "\n".join(report)
+
+def format_summary(summary: Dict[str, Any], author_identifiers: List[str]) -> str:
+    """Format the analysis summary into a readable report."""
+    return "\n".join(report_lines(summary, author_identifiers))
 
 
-def generate_final_analysis(
-    summary: Dict[str, Any], author_identifiers: List[str]
+async def generate_final_analysis(
+    summary: Dict[str, Any], author_identifiers: List[str], use_cache: bool = True
 ) -> str:
     """Generate a final consolidated analysis using the LLM."""
-    # Format the initial summary
-    initial_summary = format_summary(summary, author_identifiers)
-
-    prompt = f"""Based on the following detailed contribution analysis, generate a final consolidated analysis.
+    prompt = f"""Based on the following detailed contribution analysis of {", ".join(author_identifiers)}, generate a final consolidated analysis.
     
     Focus on:
     1. A comprehensive summary of the author's overall impact
@@ -239,30 +705,140 @@ def generate_final_analysis(
     
     Be concise, avoid repetition, and highlight the most significant contributions.
     
-    Initial analysis:
-    {initial_summary}
+    Initial analysis (JSON merged from the analyses of each chunk of commits):
+    {json.dumps(summary, ensure_ascii=False)}
     
     Respond with a well-structured final analysis that eliminates any redundancy while preserving all important information.
     """
+    system_prompt = "You are a helpful assistant that consolidates and refines technical contribution analyses to create clear, non-redundant summaries."
+
+    key = cache_key(system_prompt, prompt)
+    if use_cache:
+        cached = load_cached(key)
+        if cached is not None:
+            return cached
 
     try:
-        completion = client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a helpful assistant that consolidates and refines technical contribution analyses to create clear, non-redundant summaries.",
-                },
+        final_analysis = await create_completion(
+            [
+                {"role": "system", "content": system_prompt},
                 {"role": "user", "content": prompt},
-            ],
-            model="llama-3.3-70b-versatile",
-            temperature=0.1,
-            max_tokens=2000,
+            ]
         )
-
-        return completion.choices[0].message.content
+        if use_cache:
+            save_cached(key, final_analysis)
+        return final_analysis
     except Exception as e:
         print(f"Error generating final analysis with Groq: {e}")
-        return initial_summary
+        return format_summary(summary, author_identifiers)
+
+
+async def analyze_chunks(
+    chunks: Iterable[str], use_cache: bool = True, fast: bool = False
+) -> List[Dict[str, Any]]:
+    """Analyze chunks concurrently as they are produced, preserving the original chunk order."""
+    loop = asyncio.get_running_loop()
+    # Bounded so the git log is only read as fast as the workers consume it
+    queue: "asyncio.Queue[Optional[Tuple[int, str]]]" = asyncio.Queue(
+        maxsize=MAX_IN_FLIGHT
+    )
+    analyses: Dict[int, Optional[Dict[str, Any]]] = {}
+    # Set once the workers stop, so the producer never blocks on a full queue
+    stop = threading.Event()
+
+    def produce() -> None:
+        # Reading the git log pipe blocks, so chunks are produced in a thread
+        # while the workers are already sending earlier chunks to the API
+        def put(item: Optional[Tuple[int, str]]) -> bool:
+            future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+            while not stop.is_set():
+                try:
+                    future.result(timeout=0.1)
+                    return True
+                except concurrent.futures.TimeoutError:
+                    continue
+            future.cancel()
+            return False
+
+        try:
+            for item in enumerate(chunks):
+                if not put(item):
+                    return
+        finally:
+            if not stop.is_set():
+                for _ in range(MAX_IN_FLIGHT):
+                    put(None)
+
+    async def worker() -> None:
+        while (item := await queue.get()) is not None:
+            index, chunk = item
+            if fast:
+                analysis, unmatched = classify_conventional_commits(chunk)
+                if analysis:
+                    # Commits without a conventional subject still go to the LLM
+                    if unmatched:
+                        print(f"Processing unprefixed commits of chunk {index + 1}...")
+                        extra = await analyze_commit_chunk(
+                            "\n\n".join(unmatched), use_cache
+                        )
+                        if extra:
+                            analysis = merge_analyses([analysis, extra])
+                    analyses[index] = analysis
+                    continue
+
+            print(f"Processing chunk {index + 1}...")
+            analyses[index] = await analyze_commit_chunk(chunk, use_cache)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(MAX_IN_FLIGHT)]
+    try:
+        await asyncio.gather(asyncio.to_thread(produce), *workers)
+    finally:
+        # On an error or cancellation, release the producer and the other workers
+        stop.set()
+        for task in workers:
+            task.cancel()
+        while not queue.empty():
+            queue.get_nowait()
+    return [analyses[index] for index in sorted(analyses) if analyses[index]]
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Fetch, analyze, and report on the author's commits."""
+    try:
+        # Stream commits from git log and split them into chunks
+        commit_log = get_author_commits(
+            args.identifiers, args.max_commits, args.refresh
+        )
+        chunks = iter_chunks(commit_log)
+        first_chunk = next(chunks, None)
+        if first_chunk is None:
+            print(
+                f"No commits found for author identifiers: {', '.join(args.identifiers)}"
+            )
+            return
+
+        print("\nAnalyzing commit history...")
+
+        analyses = await analyze_chunks(
+            itertools.chain([first_chunk], chunks), not args.no_cache, args.fast
+        )
+        if not analyses:
+            print("No contributions found")
+            return
+
+        # A single analysis needs no consolidation pass, and fast mode skips it
+        if len(analyses) == 1 or args.fast:
+            print(format_summary(merge_analyses(analyses), args.identifiers))
+            return
+
+        # Merge analyses and generate final report
+        merged_summary = merge_analyses(analyses)
+        final_analysis = await generate_final_analysis(
+            merged_summary, args.identifiers, not args.no_cache
+        )
+        print(final_analysis)
+    finally:
+        await client.close()
 
 
 def main():
@@ -277,35 +853,24 @@ def main():
     parser.add_argument(
         "--max-commits", type=int, help="Maximum number of commits to analyze"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query the API instead of reusing cached analyses",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-run git log instead of reusing its cached output",
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Summarize chunks of mostly Conventional Commits locally instead of using the API",
+    )
     args = parser.parse_args()
 
-    # Get commits
-    commit_log = get_author_commits(args.identifiers, args.max_commits)
-    if not commit_log:
-        print(f"No commits found for author identifiers: {', '.join(args.identifiers)}")
-        return
-
-    # Split into chunks and analyze
-    chunks = chunk_commits(commit_log)
-    print(f"\nAnalyzing {len(chunks)} chunks of commit history...")
-
-    analyses = []
-    for i, chunk in enumerate(chunks, 1):
-        print(f"Processing chunk {i}/{len(chunks)}...")
-        analysis = analyze_commit_chunk(chunk)
-        if analysis:
-            analyses.append(analysis)
-        if i < len(chunks):
-            time.sleep(1)  # Rate limiting
-
-    if not analyses:
-        print("No contributions found")
-        return
-
-    # Merge analyses and generate final report
-    merged_summary = merge_analyses(analyses)
-    final_analysis = generate_final_analysis(merged_summary, args.identifiers)
-    print(final_analysis)
+    asyncio.run(run(args))
 
 
 if __name__ == "__main__":
@@ -1,23 +1,61 @@
 #!/usr/bin/env python3.11
 import os
+import shlex
 import subprocess
-from groq import Groq  # type: ignore
+import sys
 import argparse
 
-client = Groq(
-    api_key=os.environ.get("GROQ_API_KEY"),
-)
+# The small model handles most commands; the large one is opt-in for hard prompts
+MODEL = "llama-3.1-8b-instant"
+ACCURATE_MODEL = "llama-3.3-70b-versatile"
 
-# Ensure the Groq API key is set
-if not os.environ.get("GROQ_API_KEY"):
-    print("Please set your Groq API key as an environment variable GROQ_API_KEY.")
-    exit(1)
+# Characters that only a shell can interpret (pipes, redirects, globs, expansions, ...)
+SHELL_CHARS = set("|&;<>()$`\\*?[]{}~!#\n")
+SHELL_BUILTINS = {
+    "cd",
+    "export",
+    "source",
+    ".",
+    "alias",
+    "unset",
+    "set",
+    "exec",
+    "eval",
+}
+# Shell keywords, some of which (like time) also exist as different binaries
+SHELL_KEYWORDS = {
+    "time",
+    "if",
+    "for",
+    "while",
+    "until",
+    "case",
+    "select",
+    "function",
+    "[[",
+}
 
+# Created by get_client on first use
+client = None
 
-def generate_command(natural_language_description):
-    """Use Groq API to generate a bash command based on natural language description."""
+
+def get_client():
+    """Create the Groq client on first use, so --help and usage errors skip importing it."""
+    global client
+    if client is None:
+        from groq import Groq  # type: ignore
+
+        client = Groq(api_key=os.environ.get("GROQ_API_KEY"))
+    return client
+
+
+def generate_command(natural_language_description, echo=False, model=MODEL):
+    """Use Groq API to generate a bash command based on natural language description.
+
+    With echo set, the command is written to stdout as its tokens arrive.
+    """
     try:
-        chat_completion = client.chat.completions.create(
+        chat_completion = get_client().chat.completions.create(
             messages=[
                 {
                     "role": "system",
@@ -33,26 +71,58 @@ def generate_command(natural_language_description):
                     "content": f"Generate a bash command for: {natural_language_description}",
                 },
             ],
-            model="llama-3.3-70b-versatile",
+            model=model,
+            max_tokens=64,
+            # A command is a single line, so stop generating at the first newline
+            stop=["\n"],
+            stream=True,
         )
-        return chat_completion.choices[0].message.content.strip()
+        pieces = []
+        for chunk in chat_completion:
+            piece = chunk.choices[0].delta.content or ""
+            if echo:
+                sys.stdout.write(piece)
+                sys.stdout.flush()
+            pieces.append(piece)
+        return "".join(pieces).strip()
     except Exception as e:
         print("Error generating command:", e)
         return None
 
 
-def execute_command(command, quiet=False):
-    """Execute the generated command."""
+def needs_shell(command):
+    """Check whether a command uses shell features such as pipes, redirects or globs."""
+    if any(char in SHELL_CHARS for char in command):
+        return True
+    try:
+        args = shlex.split(command)
+    except ValueError:
+        return True
+    # Leading variable assignments, shell builtins and keywords need a shell too
+    return (
+        not args
+        or "=" in args[0]
+        or args[0] in SHELL_BUILTINS
+        or args[0] in SHELL_KEYWORDS
+    )
+
+
+def execute_command(command, quiet=False, show_command=True):
+    """Execute the generated command, streaming its output as it is produced."""
     try:
-        result = subprocess.run(command, shell=True, text=True, capture_output=True)
         if not quiet:
-            print(f"Command: {command}")
-            print("-" * 50)
-        if result.stdout:
-            print(result.stdout, end="")
-        if result.stderr:
-            print(result.stderr, end="")
-        return result.returncode == 0
+            if show_command:
+                print(f"Command: {command}")
+            print("-" * 50, flush=True)
+
+        # Run simple commands directly to skip spawning /bin/sh
+        if not needs_shell(command):
+            try:
+                return subprocess.run(shlex.split(command)).returncode == 0
+            except FileNotFoundError:
+                pass  # Not an executable on PATH, let the shell resolve it
+
+        return subprocess.run(command, shell=True).returncode == 0
     except Exception as e:
         if not quiet:
             print("Error executing command:", e)
@@ -79,18 +149,37 @@ def main():
         action="store_true",
         help="Quiet mode - only output command result (for piping)",
     )
+    parser.add_argument(
+        "-a",
+        "--accurate",
+        action="store_true",
+        help="Use a larger, slower model for complex commands",
+    )
     args = parser.parse_args()
 
-    command = generate_command(args.description)
+    # Ensure the Groq API key is set before any work or output starts
+    if not os.environ.get("GROQ_API_KEY"):
+        print("Please set your Groq API key as an environment variable GROQ_API_KEY.")
+        exit(1)
+
+    # Show the command as it streams in when someone is watching the terminal
+    echo = not args.quiet and sys.stdout.isatty()
+    if echo:
+        print("Generated command: " if args.dry_run else "Command: ", end="")
+    model = ACCURATE_MODEL if args.accurate else MODEL
+    command = generate_command(args.description, echo, model)
+    if echo:
+        print()
     if not command:
         print("Failed to generate command.")
         return
 
     if args.dry_run:
-        print(f"Generated command: {command}")
+        if not echo:
+            print(f"Generated command: {command}")
         return
 
-    execute_command(command, args.quiet)
+    execute_command(command, args.quiet, show_command=not echo)
 
 
 if __name__ == "__main__":
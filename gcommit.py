@@ -1,68 +1,311 @@
 #!/usr/bin/env python3.11
+import fnmatch
+import hashlib
+import io
+import json
 import os
 import subprocess
-from groq import Groq  # type: ignore
+import sys
+import threading
+import time
 import argparse
 import tempfile
 import re
+from concurrent.futures import ThreadPoolExecutor
+
+MAX_WORKERS = 10  # Commit diffs fetched concurrently by --last-ten
+# Largest diff sent to the model as is: Groq's 6000 tokens per minute limit for
+# llama-3.1-8b-instant caps a single request, less ~1000 tokens for the prompt
+# and response, at roughly 3 characters per token of diff
+MAX_DIFF_CHARS = (6000 - 1000) * 3
+MAX_BATCH_CHARS = MAX_DIFF_CHARS  # Combined diff text per --last-ten request
+
+# Limits applied to diffs before they are sent, modeled on GitHub's diff limits
+MAX_FILE_DIFF_CHARS = 3000  # Longer file diffs are truncated
+MAX_DIFF_FILES = 300  # Files beyond this are only counted
+MAX_DIFF_LINES = 20000  # Files beyond this many diff lines are only counted
+GENERATED_FILE_PATTERNS = [
+    "package-lock.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+    "poetry.lock",
+    "Pipfile.lock",
+    "Cargo.lock",
+    "Gemfile.lock",
+    "composer.lock",
+    "go.sum",
+    "*.min.js",
+    "*.min.css",
+    "*.map",
+    "*.snap",
+]
+
+# Constants for caching generated messages
+CACHE_DIR = os.path.expanduser("~/.cache/gcommit")
+CACHE_TTL = 24 * 60 * 60  # 1 day, in seconds
+
+MODEL = "llama-3.1-8b-instant"
+
+# System prompts are kept byte-for-byte stable so identical requests can be
+# recognized and answered from the response cache
+DIFF_SUMMARY_SYSTEM_PROMPT = (
+    "You are an AI that summarizes Git diffs concisely. "
+    "Focus on the key changes and their impact. "
+    "Keep the summary under 100 words."
+)
 
-client = Groq(
-    api_key=os.environ.get("GROQ_API_KEY"),
+COMMIT_MESSAGE_SYSTEM_PROMPT = (
+    "You are an AI that writes concise and meaningful Git commit messages following the Conventional Commits standard. "
+    "IMPORTANT: The commit message MUST follow this EXACT format: type: description\n"
+    "Where type is EXACTLY one of these words: feat, fix, chore, docs, refactor, test\n"
+    "NEVER use parentheses, scopes, or any other formatting.\n"
+    "NEVER include quotes.\n"
+    "Keep it under 30 words and all lowercase.\n"
+    "The description should be a single, concise sentence.\n"
+    "DO NOT use multiple sentences or lists.\n"
+    "DO NOT include implementation details.\n"
+    "Examples of CORRECT format:\n"
+    "- fix: optimize git diff for large files\n"
+    "- feat: add new command line argument\n"
+    "- docs: update readme with installation steps\n"
+    "Examples of INCORRECT format (DO NOT USE):\n"
+    "- fix(improved error checking)\n"
+    "- feat(gauthor): refactor analyze function\n"
+    "- fix (parser): update parsing logic\n"
+    "- fix: update get_author_commits to fetch detailed information. refactor: enhance analysis_commit_chunk\n"
+    "- feat: improve gauthor.py functionality by removing duplicate code, handling errors\n"
+    "- fix: update imports to remove type: ignore This commit message follows the Conventional Commits standard\n"
 )
 
-# Ensure the Groq API key is set
-if not os.environ.get("GROQ_API_KEY"):
-    print("Please set your Groq API key as an environment variable GROQ_API_KEY.")
-    exit(1)
+# Patterns for parsing diffs and cleaning up generated messages
+RENAME_FROM_RE = re.compile(r"^rename from (.+)$", re.MULTILINE)
+RENAME_TO_RE = re.compile(r"^rename to (.+)$", re.MULTILINE)
+BINARY_RE = re.compile(r"^Binary files (.+) and (.+) differ$", re.MULTILINE)
+HUNK_HEADER_RE = re.compile(r"(^@@ -\d+(?:,\d+)? \+\d+(?:,\d+)? @@)", re.MULTILINE)
+PARENS_RE = re.compile(r"\([^)]*\):")
+WHITESPACE_RE = re.compile(r"\s+")
+
+# Created by get_client on first use
+client = None
+client_lock = threading.Lock()
+
+
+def get_client():
+    """Create the Groq client on first use, so cached and --help runs skip importing it."""
+    global client
+    with client_lock:
+        if client is None:
+            import httpx
+            from groq import Groq  # type: ignore
+
+            # Keep connections alive across requests, so only the first request
+            # to Groq pays for the TLS handshake
+            client = Groq(
+                api_key=os.environ.get("GROQ_API_KEY"),
+                http_client=httpx.Client(
+                    limits=httpx.Limits(
+                        max_connections=MAX_WORKERS,
+                        max_keepalive_connections=MAX_WORKERS,
+                    ),
+                    timeout=30.0,
+                ),
+            )
+    return client
 
 
-def optimize_diff(diff):
-    """Optimize the diff by removing file moves and unnecessary content."""
-    if not diff:
-        return ""
+# Responses to earlier identical requests, keyed by a hash of the request
+response_cache = {}
+response_cache_lock = threading.Lock()
 
-    # Split diff into individual file diffs
-    file_diffs = re.split(r"^diff --git", diff, flags=re.MULTILINE)
-    optimized_diffs = []
 
-    for file_diff in file_diffs:
-        if not file_diff.strip():
-            continue
+def load_cached(key, ttl=CACHE_TTL):
+    """Return the response cached on disk for the key, or None if missing or expired."""
+    cache_path = os.path.join(CACHE_DIR, key)
+    try:
+        if ttl is not None and time.time() - os.path.getmtime(cache_path) > ttl:
+            return None
+        with open(cache_path, "r") as f:
+            return f.read()
+    except OSError:
+        return None
+
 
-        # Handle file moves/renames
-        rename_from = re.search(r"^rename from (.+)$", file_diff, re.MULTILINE)
-        rename_to = re.search(r"^rename to (.+)$", file_diff, re.MULTILINE)
+def save_cached(key, value):
+    """Atomically write a response to the on-disk cache."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(value)
+        os.replace(tmp_path, os.path.join(CACHE_DIR, key))
+    except OSError as e:
+        print("Error writing cache:", e)
+
+
+def complete(system_prompt, user_prompt, use_cache=True, echo=False, **kwargs):
+    """Request a chat completion from Groq, reusing the response to an identical request.
+
+    With echo set, the response is streamed and written to stdout as its tokens arrive.
+    Any other keyword arguments are passed on to the completion request.
+    """
+    key = hashlib.blake2b(
+        "\0".join((MODEL, system_prompt, user_prompt)).encode()
+    ).hexdigest()
+    if use_cache:
+        with response_cache_lock:
+            if key in response_cache:
+                return response_cache[key]
+        cached = load_cached(key)
+        if cached is not None:
+            if echo:
+                print(cached)
+            return cached
+
+    chat_completion = get_client().chat.completions.create(
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ],
+        model=MODEL,
+        stream=echo,
+        **kwargs,
+    )
+    if echo:
+        pieces = []
+        for chunk in chat_completion:
+            piece = chunk.choices[0].delta.content or ""
+            sys.stdout.write(piece)
+            sys.stdout.flush()
+            pieces.append(piece)
+        print()
+        response = "".join(pieces).strip()
+    else:
+        response = chat_completion.choices[0].message.content.strip()
+
+    with response_cache_lock:
+        response_cache[key] = response
+    save_cached(key, response)
+    return response
+
+
+def split_file_diffs(diff):
+    """Split a diff into per-file diffs, dropping the leading "diff --git" of each."""
+    # A plain string split is much faster than a multiline regex split; the
+    # sentinel newline lets the first file header match the separator too
+    parts = ("\n" + diff).split("\ndiff --git")
+
+    # Restore the newline consumed by each separator and drop the sentinel
+    file_diffs = [part + "\n" for part in parts[:-1]] + parts[-1:]
+    file_diffs[0] = file_diffs[0][1:]
+    return file_diffs
+
+
+def iter_file_diffs(lines):
+    """Group streamed diff lines into one diff per file."""
+    file_diff = []
+    for line in lines:
+        if line.startswith("diff --git") and file_diff:
+            yield "".join(file_diff)
+            file_diff = []
+        file_diff.append(line)
+
+    if file_diff:
+        yield "".join(file_diff)
+
+
+def count_changed_lines(file_diff):
+    """Count the added and removed lines in a file's diff."""
+    added = removed = 0
+    for line in file_diff.splitlines():
+        if line.startswith("+") and not line.startswith("+++"):
+            added += 1
+        elif line.startswith("-") and not line.startswith("---"):
+            removed += 1
+    return added, removed
+
+
+def optimize_file_diff(file_diff):
+    """Optimize a single file's diff by collapsing file moves, binary and generated files."""
+    # Handle file moves/renames, only running the regexes when a rename is present
+    if "rename from " in file_diff:
+        rename_from = RENAME_FROM_RE.search(file_diff)
+        rename_to = RENAME_TO_RE.search(file_diff)
         if rename_from and rename_to:
-            optimized_diffs.append(
+            return (
                 f"# file renamed from {rename_from.group(1)} to {rename_to.group(1)}\n"
             )
-            continue
 
-        # Handle binary files
-        binary_match = re.search(
-            r"^Binary files (.+) and (.+) differ$", file_diff, re.MULTILINE
+    # Handle binary files
+    binary_match = "Binary files " in file_diff and BINARY_RE.search(file_diff)
+    if binary_match:
+        return f"# binary file changed: {binary_match.group(1)} -> {binary_match.group(2)}\n"
+
+    # Collapse lockfiles, minified bundles and snapshots to a line count
+    header = file_diff.split("\n", 1)[0]
+    path = header.rsplit(" b/", 1)[-1] if header.startswith("diff --git") else ""
+    name = os.path.basename(path)
+    if any(fnmatch.fnmatch(name, pattern) for pattern in GENERATED_FILE_PATTERNS):
+        added, removed = count_changed_lines(file_diff)
+        return (
+            f"# large autogenerated file {path} changed (+{added}/-{removed} lines)\n"
         )
-        if binary_match:
-            optimized_diffs.append(
-                f"# binary file changed: {binary_match.group(1)} -> {binary_match.group(2)}\n"
-            )
+
+    # Cap the diff of any single file
+    if len(file_diff) > MAX_FILE_DIFF_CHARS:
+        cut = file_diff.rfind("\n", 0, MAX_FILE_DIFF_CHARS) + 1 or MAX_FILE_DIFF_CHARS
+        return f"{file_diff[:cut]}# diff of {path or 'file'} truncated\n"
+
+    return file_diff
+
+
+def optimize_diff(file_diffs):
+    """Optimize a diff given as per-file diffs by removing file moves and unnecessary content."""
+    optimized_diffs = []
+    total_lines = 0
+    omitted_files = 0
+
+    for file_diff in file_diffs:
+        if not file_diff.strip():
+            continue
+
+        # Stop including file diffs once the overall limits are reached
+        if len(optimized_diffs) >= MAX_DIFF_FILES or total_lines >= MAX_DIFF_LINES:
+            omitted_files += 1
             continue
 
-        optimized_diffs.append(file_diff)
+        optimized_diff = optimize_file_diff(file_diff)
+        total_lines += optimized_diff.count("\n")
+        optimized_diffs.append(optimized_diff)
+
+    if omitted_files:
+        optimized_diffs.append(f"# {omitted_files} more files changed, diff omitted\n")
 
     return "".join(optimized_diffs)
 
 
+def read_git_diff(cmd):
+    """Run a git diff command, optimizing its output file by file as it streams in."""
+    # Git's errors are discarded as before, and a failed command yields no diff
+    process = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+    )
+    with process.stdout:
+        diff = optimize_diff(iter_file_diffs(process.stdout))
+    if process.wait() != 0:
+        return ""
+    return diff.strip()
+
+
 def chunk_diff(diff, max_chunk_size=4000):
     """Split large diffs into smaller chunks."""
     if not diff:
         return []
 
-    # Split by file diffs first
-    file_diffs = re.split(r"^diff --git", diff, flags=re.MULTILINE)
+    # Split by file diffs first, writing each chunk into a buffer whose
+    # position doubles as its size
+    file_diffs = split_file_diffs(diff)
     chunks = []
-    current_chunk = []
-    current_size = 0
+    current_chunk = io.StringIO()
 
     for file_diff in file_diffs:
         if not file_diff.strip():
@@ -71,41 +314,36 @@ def chunk_diff(diff, max_chunk_size=4000):
         # If a single file diff is too large, split it by hunks
         if len(file_diff) > max_chunk_size:
             # Split by hunk headers (@@ -line,count +line,count @@)
-            hunks = re.split(
-                r"(^@@ -\d+(?:,\d+)? \+\d+(?:,\d+)? @@)", file_diff, flags=re.MULTILINE
-            )
-            current_hunk = []
-            current_hunk_size = 0
+            hunks = HUNK_HEADER_RE.split(file_diff)
+            current_hunk = io.StringIO()
 
             for hunk in hunks:
                 if not hunk.strip():
                     continue
 
                 # If adding this hunk would exceed chunk size, start a new chunk
-                if current_hunk_size + len(hunk) > max_chunk_size and current_hunk:
-                    chunks.append("".join(current_hunk))
-                    current_hunk = []
-                    current_hunk_size = 0
+                size = current_hunk.tell()
+                if size + len(hunk) > max_chunk_size and size:
+                    chunks.append(current_hunk.getvalue())
+                    current_hunk = io.StringIO()
 
-                current_hunk.append(hunk)
-                current_hunk_size += len(hunk)
+                current_hunk.write(hunk)
 
             # Add the last hunk chunk if it exists
-            if current_hunk:
-                chunks.append("".join(current_hunk))
+            if current_hunk.tell():
+                chunks.append(current_hunk.getvalue())
         else:
             # If adding this file would exceed chunk size, start a new chunk
-            if current_size + len(file_diff) > max_chunk_size and current_chunk:
-                chunks.append("".join(current_chunk))
-                current_chunk = []
-                current_size = 0
+            size = current_chunk.tell()
+            if size + len(file_diff) > max_chunk_size and size:
+                chunks.append(current_chunk.getvalue())
+                current_chunk = io.StringIO()
 
-            current_chunk.append(file_diff)
-            current_size += len(file_diff)
+            current_chunk.write(file_diff)
 
     # Add the last chunk if it exists
-    if current_chunk:
-        chunks.append("".join(current_chunk))
+    if current_chunk.tell():
+        chunks.append(current_chunk.getvalue())
 
     return chunks
 
@@ -113,150 +351,133 @@ def chunk_diff(diff, max_chunk_size=4000):
 def summarize_diff_chunk(chunk):
     """Generate a summary of a diff chunk using Groq."""
     try:
-        chat_completion = client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are an AI that summarizes Git diffs concisely. "
-                        "Focus on the key changes and their impact. "
-                        "Keep the summary under 100 words."
-                    ),
-                },
-                {
-                    "role": "user",
-                    "content": f"Summarize this Git diff chunk:\n{chunk}",
-                },
-            ],
-            model="llama-3.1-8b-instant",
+        return complete(
+            DIFF_SUMMARY_SYSTEM_PROMPT, f"Summarize this Git diff chunk:\n{chunk}"
         )
-        return chat_completion.choices[0].message.content.strip()
     except Exception as e:
         print("Error summarizing diff chunk:", e)
         return None
 
 
 def process_diff(diff):
-    """Process a diff by optimizing and chunking if necessary."""
+    """Summarize an optimized diff in chunks if it is too large to send at once."""
     if not diff:
         return None
 
-    # Optimize the diff
-    optimized_diff = optimize_diff(diff)
-
-    # If diff is too large, chunk it
-    if len(optimized_diff) > 4000:
-        chunks = chunk_diff(optimized_diff)
+    # Only summarize the diff in chunks if it cannot be sent in a single request
+    if len(diff) > MAX_DIFF_CHARS:
+        chunks = chunk_diff(diff, MAX_DIFF_CHARS)
         summaries = []
         for chunk in chunks:
             summary = summarize_diff_chunk(chunk)
             if summary:
                 summaries.append(summary)
-        return "\n\n".join(summaries) if summaries else optimized_diff
+        return "\n\n".join(summaries) if summaries else diff
 
-    return optimized_diff
+    return diff
 
 
 def get_git_diff():
     """Get the current git diff as a string."""
     try:
-        result = subprocess.run(
-            ["git", "diff", "--cached"], capture_output=True, text=True
-        )
-        return process_diff(result.stdout.strip())
+        return process_diff(read_git_diff(["git", "diff", "--cached"]))
     except Exception as e:
         print("Error fetching git diff:", e)
         return None
 
 
 def get_git_commit_content(commit_hash):
-    """Get the git diff for a specific commit."""
+    """Get the optimized git diff for a specific commit, without summarizing it."""
     try:
-        result = subprocess.run(
-            ["git", "show", commit_hash, "--pretty=format:", "--unified=0"],
-            capture_output=True,
-            text=True,
+        return read_git_diff(
+            ["git", "show", commit_hash, "--pretty=format:", "--unified=0"]
         )
-        return process_diff(result.stdout.strip())
     except Exception as e:
         print(f"Error fetching git diff for {commit_hash}:", e)
         return None
 
 
-def generate_commit_message(diff):
+def clean_commit_message(message):
+    """Normalize a generated message into a single Conventional Commits sentence."""
+    # Clean up any remaining parentheses if they somehow got through; the
+    # substring checks skip the regexes in the common case
+    if "(" in message:
+        message = PARENS_RE.sub(":", message)
+    if any(ws in message for ws in ("  ", "\t", "\n", "\r")):
+        message = WHITESPACE_RE.sub(" ", message)
+    message = message.strip()
+
+    # Ensure single sentence
+    if "." in message:
+        message = message.split(".")[0].strip()
+
+    return message
+
+
+def generate_commit_message(diff, use_cache=True, echo=False):
     """Use Groq API to generate a commit message based on the diff."""
     if not diff:
         print("No staged changes to commit.")
         return None
 
     try:
-        chat_completion = client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": (
-                        "You are an AI that writes concise and meaningful Git commit messages following the Conventional Commits standard. "
-                        "IMPORTANT: The commit message MUST follow this EXACT format: type: description\n"
-                        "Where type is EXACTLY one of these words: feat, fix, chore, docs, refactor, test\n"
-                        "NEVER use parentheses, scopes, or any other formatting.\n"
-                        "NEVER include quotes.\n"
-                        "Keep it under 30 words and all lowercase.\n"
-                        "The description should be a single, concise sentence.\n"
-                        "DO NOT use multiple sentences or lists.\n"
-                        "DO NOT include implementation details.\n"
-                        "Examples of CORRECT format:\n"
-                        "- fix: optimize git diff for large files\n"
-                        "- feat: add new command line argument\n"
-                        "- docs: update readme with installation steps\n"
-                        "Examples of INCORRECT format (DO NOT USE):\n"
-                        "- fix(improved error checking)\n"
-                        "- feat(gauthor): refactor analyze function\n"
-                        "- fix (parser): update parsing logic\n"
-                        "- fix: update get_author_commits to fetch detailed information. refactor: enhance analysis_commit_chunk\n"
-                        "- feat: improve gauthor.py functionality by removing duplicate code, handling errors\n"
-                        "- fix: update imports to remove type: ignore This commit message follows the Conventional Commits standard\n"
-                    ),
-                },
-                {
-                    "role": "user",
-                    "content": (
-                        "Generate a properly formatted Git commit message following Conventional Commits based on the following changes:\n"
-                        f"{diff}"
-                    ),
-                },
-            ],
-            model="llama-3.1-8b-instant",
+        message = complete(
+            COMMIT_MESSAGE_SYSTEM_PROMPT,
+            "Generate a properly formatted Git commit message following Conventional Commits based on the following changes:\n"
+            f"{diff}",
+            use_cache,
+            echo,
         )
-        message = chat_completion.choices[0].message.content.strip()
+        return clean_commit_message(message)
+    except Exception as e:
+        print("Error generating commit message:", e)
+        return None
 
-        # Clean up any remaining parentheses if they somehow got through
-        message = re.sub(r"\([^)]*\):", ":", message)
-        message = re.sub(r"\s+", " ", message).strip()
 
-        # Ensure single sentence
-        if "." in message:
-            message = message.split(".")[0].strip()
+def generate_commit_messages(diffs, use_cache=True):
+    """Generate commit messages for several diffs with a single Groq request.
 
-        return message
+    Returns None if the response does not hold exactly one message per diff.
+    """
+    sections = "\n".join(f"---DIFF {i}---\n{diff}" for i, diff in enumerate(diffs, 1))
+    try:
+        response = complete(
+            COMMIT_MESSAGE_SYSTEM_PROMPT,
+            "Generate a properly formatted Git commit message following Conventional Commits for each of the following changes. "
+            'Respond with JSON of the form {"messages": [...]} holding one message per diff, in order:\n'
+            f"{sections}",
+            use_cache,
+            response_format={"type": "json_object"},
+        )
+        messages = json.loads(response).get("messages")
+        if (
+            isinstance(messages, list)
+            and len(messages) == len(diffs)
+            and all(isinstance(message, str) for message in messages)
+        ):
+            return [clean_commit_message(message) for message in messages]
+        print("Error generating commit messages: unexpected response format")
     except Exception as e:
-        print("Error generating commit message:", e)
-        return None
+        print("Error generating commit messages:", e)
+    return None
 
 
 def edit_message(initial_message):
     """Open a temporary file for the user to edit the commit message."""
-    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as temp_file:
-        temp_file.write(initial_message)
-        temp_file.flush()
+    fd, path = tempfile.mkstemp()
+    try:
+        # Close the file before the editor opens it, then read back whatever
+        # ends up at the path, since many editors save by replacing the file
+        with os.fdopen(fd, "w") as temp_file:
+            temp_file.write(initial_message)
 
         editor = os.getenv("EDITOR", "nano")  # Default to nano if EDITOR is not set
-        subprocess.run([editor, temp_file.name])
-
-        with open(temp_file.name, "r") as f:
-            edited_message = f.read().strip()
+        subprocess.run([editor, path])
 
-        os.unlink(temp_file.name)  # Remove temp file
-    return edited_message
+        with open(path, "r") as f:
+            return f.read().strip()
+    finally:
+        os.unlink(path)  # Remove temp file
 
 
 def commit_changes(message):
@@ -268,7 +489,34 @@ def commit_changes(message):
         print("Error committing changes:", e)
 
 
-def get_last_commit_messages():
+def commit_cache_key(commit_hash):
+    """Return the cache key for the generated message of an existing commit."""
+    return hashlib.sha256(f"{MODEL}\0{commit_hash}".encode()).hexdigest()
+
+
+def batch_diffs(commit_hashes, diffs):
+    """Group commits into batches whose combined diffs fit in a single request."""
+    batches = []
+    current_batch = []
+    current_size = 0
+
+    for commit_hash in commit_hashes:
+        size = len(diffs[commit_hash])
+        if current_size + size > MAX_BATCH_CHARS and current_batch:
+            batches.append(current_batch)
+            current_batch = []
+            current_size = 0
+
+        current_batch.append(commit_hash)
+        current_size += size
+
+    if current_batch:
+        batches.append(current_batch)
+
+    return batches
+
+
+def get_last_commit_messages(use_cache=True):
     """Retrieve diffs for the last 10 commits and generate commit messages."""
     try:
         result = subprocess.run(
@@ -276,14 +524,44 @@ def get_last_commit_messages():
             capture_output=True,
             text=True,
         )
-        commit_hashes = result.stdout.split("\n")
+        commit_hashes = [h for h in result.stdout.splitlines() if h]
+
+        # A commit's content never changes, so its message is cached without expiry
+        messages = {}
+        if use_cache:
+            for commit_hash in commit_hashes:
+                cached = load_cached(commit_cache_key(commit_hash), ttl=None)
+                if cached is not None:
+                    messages[commit_hash] = cached
+        pending = [h for h in commit_hashes if h not in messages]
+
+        # Fetch the remaining diffs concurrently; only git runs in the pool
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            diffs = dict(zip(pending, executor.map(get_git_commit_content, pending)))
+
+        # A single summary or batch request can fill the per-minute token
+        # budget on its own, so every request to Groq is sent one at a time
+        diffs = {h: process_diff(diff) for h, diff in diffs.items()}
+        pending = [h for h in pending if diffs[h]]
+
+        # Generate the messages for each batch of diffs with a single request
+        for batch in batch_diffs(pending, diffs):
+            batch_messages = generate_commit_messages(
+                [diffs[h] for h in batch], use_cache
+            )
+            if batch_messages is None:
+                # Fall back to one request per commit
+                batch_messages = [
+                    generate_commit_message(diffs[h], use_cache) for h in batch
+                ]
+            for commit_hash, message in zip(batch, batch_messages):
+                if message:
+                    messages[commit_hash] = message
+                    save_cached(commit_cache_key(commit_hash), message)
 
         for commit_hash in commit_hashes:
-            diff = get_git_commit_content(commit_hash)
-            if not diff:
-                continue
-            generated_message = generate_commit_message(diff)
-            print(f"Commit {commit_hash[:7]}: {generated_message}")
+            if messages.get(commit_hash):
+                print(f"Commit {commit_hash[:7]}: {messages[commit_hash]}")
     except Exception as e:
         print("Error fetching commit diffs:", e)
 
@@ -304,10 +582,20 @@ def main():
         action="store_true",
         help="Output generated commit messages for the last 10 commits.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Generate a fresh message instead of reusing a cached one.",
+    )
     args = parser.parse_args()
 
+    # Ensure the Groq API key is set before any work or output starts
+    if not os.environ.get("GROQ_API_KEY"):
+        print("Please set your Groq API key as an environment variable GROQ_API_KEY.")
+        exit(1)
+
     if args.last_ten:
-        get_last_commit_messages()
+        get_last_commit_messages(not args.no_cache)
         return
 
     diff = get_git_diff()
@@ -315,7 +603,11 @@ def main():
         print("No staged changes. Use 'git add' before running gcommit.")
         return
 
-    commit_message = generate_commit_message(diff)
+    # Stream the message as it is generated when someone is watching the terminal
+    echo = sys.stdout.isatty()
+    if echo:
+        print("Generating commit message: ", end="")
+    commit_message = generate_commit_message(diff, not args.no_cache, echo)
     if not commit_message:
         print("Failed to generate commit message.")
         return